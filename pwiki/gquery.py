@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Union
 from .dwrap import Contrib, Log, Revision
 from .ns import NS
 from .query_constants import ListCont, PropCont, PropContSingle, QConstant
-from .query_utils import get_continue_params, query_and_validate
+from .query_utils import extract_body, get_continue_params, query_and_validate
 from .utils import mine_for
 
 if TYPE_CHECKING:
@@ -41,7 +41,7 @@ class GQuery:
         """
         params = {**template.pl_with_limit(limit_value), "list": template.name} | (extra_pl or {})
         while True:
-            if not (response := query_and_validate(wiki, params, desc=f"peform a list_cont query with '{template.name}'")):
+            if not (response := query_and_validate(wiki, params, desc=f"peform a list_cont query with '{template.name}'", cacheable=template.cacheable)):
                 raise OSError(f"Critical failure performing a list_cont query with {template.name}, cannot proceed")
 
             if template.name not in (q := mine_for(response, "query")) or not (result := template.retrieve_results(q[template.name])):
@@ -74,10 +74,10 @@ class GQuery:
         params = {**template.pl_with_limit(limit_value), "prop": template.name, "titles": title} | (extra_pl or {})
 
         while True:
-            if not (response := query_and_validate(wiki, params, desc=f"peform a prop_cont query with '{template.name}'")):
+            if not (response := query_and_validate(wiki, params, desc=f"peform a prop_cont query with '{template.name}'", cacheable=template.cacheable)):
                 raise OSError(f"Critical failure performing a prop_cont query with {template.name}, cannot proceed")
 
-            if not ((l := mine_for(response, "query", "pages")) and template.name in (p := l[0])):
+            if not ((l := extract_body("pages", response)) and template.name in (p := l[0])):
                 break
 
             yield template.retrieve_results(p[template.name])
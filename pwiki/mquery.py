@@ -9,8 +9,8 @@ from typing import TYPE_CHECKING, Union
 
 from .ns import NS
 from .query_constants import PropCont, PropNoCont, QConstant
-from .query_utils import chunker, denormalize_result, get_continue_params, query_and_validate
-from .utils import mine_for, PROP_TITLE_MAX
+from .query_utils import chunker, denormalize_result, extract_body, get_continue_params, query_and_validate
+from .utils import PROP_TITLE_MAX
 
 if TYPE_CHECKING:
     from .wiki import Wiki
@@ -36,13 +36,15 @@ class MQuery:
         """
         out = defaultdict(list, {t: [] for t in titles})
 
-        for chunk in chunker(titles, wiki.prop_title_max):
+        for chunk in chunker(dict.fromkeys(titles), wiki.prop_title_max):  # dedupe, repeated titles would only waste space in each request
             params = {**template.pl_with_limit(), "prop": template.name, "titles": "|".join(chunk)} | (extra_pl or {})
 
-            while response := query_and_validate(wiki, params, wiki.is_bot, f"peform a prop_cont query with '{template.name}'"):
-                for p in mine_for(response, "query", "pages"):
+            while response := query_and_validate(wiki, params, wiki.is_bot, f"peform a prop_cont query with '{template.name}'", template.cacheable):
+                for p in extract_body("pages", response):
                     try:
-                        out[p["title"]] += template.retrieve_results(p[template.name]) if template.name in p else []
+                        l = out[p["title"]]  # touch the key, denormalize_result() expects every returned title to be present
+                        if template.name in p:
+                            l.extend(template.retrieve_results(p[template.name]))
                     except Exception:
                         log.debug("%s: Unable able to parse prop value from: %s", wiki, p, exc_info=True)
                         return dict.fromkeys(titles)
@@ -68,15 +70,44 @@ class MQuery:
         Returns:
             dict: A dict where each key is a title and the value is the corresponding value that was retrieved from the server.  A `None` value means something probably went wrong server side.
         """
-        out = dict.fromkeys(titles)
+        return {k: v[template] for k, v in MQuery.batch_prop_no_cont(wiki, titles, [template]).items()}
 
-        for chunk in chunker(titles, wiki.prop_title_max):
-            if response := query_and_validate(wiki, {**template.pl, "prop": template.name, "titles": "|".join(chunk)}, len(chunk) > PROP_TITLE_MAX, f"peform a prop_no_cont query with '{template.name}'"):
-                for p in mine_for(response, "query", "pages"):
-                    try:
-                        out[p["title"]] = template.retrieve_results(p)
-                    except Exception:
-                        log.debug("%s: Unable able to parse prop value from: %s", wiki, p, exc_info=True)
+    @staticmethod
+    def batch_prop_no_cont(wiki: Wiki, titles: list[str], templates: list[QConstant]) -> dict:
+        """Fetches several one-off page properties (see `PropNoCont`) for each title, combining them into a single prop query per chunk of titles.
+
+        Args:
+            wiki (Wiki): The Wiki object to use.
+            titles (list[str]): The titles to work on.
+            templates (list[QConstant]): The `PropNoCont` QConstants to fetch.  Each must use a distinct prop and distinct parameters.
+
+        Raises:
+            ValueError: If two of the `templates` share a prop name or a parameter.
+
+        Returns:
+            dict: A dict where each key is a title and each value is a dict mapping each of `templates` to the corresponding value that was retrieved from the server.  A `None` value means something probably went wrong server side.
+        """
+        if len({template.name for template in templates}) < len(templates):
+            raise ValueError("Each template must use a distinct prop")
+
+        pl = {"prop": "|".join(template.name for template in templates)}
+        for template in templates:
+            if not pl.keys().isdisjoint(template.pl):
+                raise ValueError(f"The parameters of '{template.name}' collide with those of the other templates")
+
+            pl |= template.pl
+
+        out = {t: dict.fromkeys(templates) for t in titles}
+
+        for chunk in chunker(dict.fromkeys(titles), wiki.prop_title_max):  # dedupe, repeated titles would only waste space in each request
+            if response := query_and_validate(wiki, {**pl, "titles": "|".join(chunk)}, len(chunk) > PROP_TITLE_MAX, f"peform a prop_no_cont query with '{pl['prop']}'", all(template.cacheable for template in templates)):
+                for p in extract_body("pages", response):
+                    out[p["title"]] = values = dict.fromkeys(templates)
+                    for template in templates:
+                        try:
+                            values[template] = template.retrieve_results(p)
+                        except Exception:
+                            log.debug("%s: Unable able to parse '%s' value from: %s", wiki, template.name, p, exc_info=True)
 
                 denormalize_result(out, response)
 
@@ -43,6 +43,7 @@ class NSManager:
             r (dict): The response from the server.  This should be the json object directly under the `"query"` object.
         """
         self.m = {}
+        self.prefix_by_id = {}  # id -> canonical prefix, see canonical_prefix()
 
         l = []
         for v in r["namespaces"].values():
@@ -51,6 +52,7 @@ class NSManager:
 
             self.m[id] = name
             self.m[name] = id
+            self.prefix_by_id[id] = "" if id == NS.MAIN else name + ":"
             l.append(name)
 
             # handle canonical namespaces (e.g. Project is also Wikipedia)
@@ -62,6 +64,8 @@ class NSManager:
         self.m |= (aliases := {e["alias"]: e["id"] for e in r["namespacealiases"]})
         l += aliases.keys()
 
+        self.talk_ids = {id for id in self.prefix_by_id if id >= 0 and id % 2}
+
         self.ns_regex = re.compile(f'(?i)^({"|".join([s.replace(" ", "[ |]") for s in l])}):')
 
     def batch_convert_ns(self, titles: Iterable[str], ns: Union[str, NS], replace_underscores: bool = False) -> list[str]:
@@ -144,3 +148,14 @@ class NSManager:
             str: The name of `ns` as a `str`.
         """
         return self.m.get(ns) if isinstance(ns, int) else ns
+
+    def which_ns(self, title: str) -> str:
+        """Determines which namespace a title belongs to.
+
+        Args:
+            title (str): The title to get the namespace of
+
+        Returns:
+            str: The namespace, without it's `:` suffix.  If main namespace, then `"Main"` will be returned
+        """
+        return result[1] if (result := self.ns_regex.match(title)) else MAIN_NAME
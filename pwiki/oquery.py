@@ -7,7 +7,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from .ns import NSManager
-from .query_utils import chunker, extract_body, mine_for, query_and_validate
+from .query_utils import chunker, extract_body, query_and_validate
 
 if TYPE_CHECKING:
     from .wiki import Wiki
@@ -34,13 +34,34 @@ class OQuery:
         """
         out = {s: s for s in titles}
 
-        for chunk in chunker(titles, wiki.prop_title_max):
-            if response := extract_body(id, query_and_validate(wiki, {**pl, "titles": "|".join(chunk)}, wiki.is_bot, desc)):
+        for chunk in chunker(dict.fromkeys(titles), wiki.prop_title_max):  # dedupe, repeated titles would only waste space in each request
+            if response := extract_body(id, query_and_validate(wiki, {**pl, "titles": "|".join(chunk)}, wiki.is_bot, desc, True)):
                 for e in response:
                     out[e["from"]] = e["to"]
 
         return out
 
+    @staticmethod
+    def fetch_session_info(wiki: Wiki) -> tuple[str, str, list[str], NSManager]:
+        """Fetch a csrf token, the username and user groups of the account `wiki` is logged in as, and the Wiki's namespace data, in a single query.
+
+        Args:
+            wiki (Wiki): The Wiki object to use
+
+        Raises:
+            OSError: if there was a server error or the session info couldn't be retrieved.
+
+        Returns:
+            tuple[str, str, list[str], NSManager]: A tuple such that the first element is the csrf token, the second element is the username, the third element is the user's rights on-wiki, and the fourth element is an NSManager containing namespace data.
+        """
+        log.debug("%s: Fetching csrf token, user info, and namespace data...", wiki)
+
+        if response := query_and_validate(wiki, {"meta": "tokens|userinfo|siteinfo", "uiprop": "groups", "siprop": "namespaces|namespacealiases"}, desc="fetch csrf token, user info, and namespace data"):
+            user_info = extract_body("userinfo", response)
+            return extract_body("tokens", response)["csrftoken"], user_info["name"], user_info.get("groups", []), NSManager(response["query"])
+
+        raise OSError(f"{wiki}: Could not retrieve csrf token, user info, and namespace data, network error?")
+
     @staticmethod
     def fetch_token(wiki: Wiki, login_token: bool = False) -> str:
         """Fetch a csrf or login token from the server.  By default, this method will retrieve a csrf token.
@@ -79,7 +100,7 @@ class OQuery:
         """
         log.debug("%s: Fetching namespace data...", wiki)
 
-        if response := query_and_validate(wiki, {"meta": "siteinfo", "siprop": "namespaces|namespacealiases"}, desc="obtain namespace data"):
+        if response := query_and_validate(wiki, {"meta": "siteinfo", "siprop": "namespaces|namespacealiases"}, desc="obtain namespace data", cacheable=True):
             return NSManager(response["query"])
 
         raise OSError(f"{wiki}: Could not retrieve namespace data, network error?")
@@ -98,8 +119,8 @@ class OQuery:
         out = {}
 
         for chunk in chunker(users, wiki.prop_title_max):
-            if response := query_and_validate(wiki, {"list": "users", "usprop": "groups", "ususers": "|".join(chunk)}, wiki.is_bot, "determine user rights"):
-                for p in mine_for(response, "query", "users"):
+            if response := query_and_validate(wiki, {"list": "users", "usprop": "groups", "ususers": "|".join(chunk)}, wiki.is_bot, "determine user rights", True):
+                for p in extract_body("users", response):
                     out[p["name"]] = p.get("groups")
 
         return out
@@ -137,7 +158,7 @@ class OQuery:
         Returns:
             set: A set containing all acceptable file types as their extensions ("." prefix is included).  None if something went wrong.
         """
-        if response := query_and_validate(wiki, {"meta": "siteinfo", "siprop": "fileextensions"}, desc="fetch acceptable file upload extensions"):
+        if response := query_and_validate(wiki, {"meta": "siteinfo", "siprop": "fileextensions"}, desc="fetch acceptable file upload extensions", cacheable=True):
             return {jo["ext"] for jo in extract_body("fileextensions", response)}
 
     @staticmethod
@@ -1,5 +1,6 @@
 """Constants shared between query classes"""
 
+from operator import itemgetter
 from typing import Any, Callable, Union
 
 from .dwrap import Contrib, ImageInfo, Log, Revision
@@ -7,11 +8,89 @@ from .utils import mine_for
 
 MAX = "max"
 
+_get_name = itemgetter("name")
+_get_stash_info = itemgetter("filekey", "size", "status")
+_get_title = itemgetter("title")
+_get_title_wiki = itemgetter("title", "wiki")
+_get_url = itemgetter("url")
+
+
+def _titles(l: list) -> list[str]:
+    """Default `prop`/`list` retrieval function, gets the `"title"` of each json object in `l`."""
+    return list(map(_get_title, l))
+
+
+def _names(l: list) -> list[str]:
+    """Gets the `"name"` of each json object in `l`."""
+    return list(map(_get_name, l))
+
+
+def _shared_names(l: list) -> list[str]:
+    """Gets the `"name"` of each json object in `l` which was marked as `"shared"`."""
+    return [e["name"] for e in l if e.get("shared")]
+
+
+def _title_wiki_pairs(l: list) -> list[tuple[str, str]]:
+    """Gets the `"title"` and `"wiki"` of each json object in `l` as a `tuple`."""
+    return list(map(_get_title_wiki, l))
+
+
+def _urls(l: list) -> list[str]:
+    """Gets the `"url"` of each json object in `l`."""
+    return list(map(_get_url, l))
+
+
+def _image_infos(l: list) -> list[ImageInfo]:
+    """Wraps each json object in `l` as an `ImageInfo`."""
+    return list(map(ImageInfo, l))
+
+
+def _revisions(l: list) -> list[Revision]:
+    """Wraps each json object in `l` as a `Revision`."""
+    return list(map(Revision, l))
+
+
+def _contribs(l: list) -> list[Contrib]:
+    """Wraps each json object in `l` as a `Contrib`."""
+    return list(map(Contrib, l))
+
+
+def _logs(l: list) -> list[Log]:
+    """Wraps each json object in `l` as a `Log`."""
+    return list(map(Log, l))
+
+
+def _query_page_titles(q: dict) -> list[str]:
+    """Gets the `"title"` of each json object in the `"results"` of a `querypage` response."""
+    return list(map(_get_title, q["results"]))
+
+
+def _stashed_files(l: list) -> list[tuple[str, int, str]]:
+    """Gets the `"filekey"`, `"size"`, and `"status"` of each json object in `l` as a `tuple`."""
+    return list(map(_get_stash_info, l))
+
+
+def _exists(r: dict) -> bool:
+    """Determines if the page json object `r` represents a page that exists."""
+    return "missing" not in r
+
+
+def _category_size(r: dict) -> int:
+    """Gets the size of the category represented by the page json object `r`."""
+    return mine_for(r, "categoryinfo", "size") or 0
+
+
+def _page_text(r: dict) -> str:
+    """Gets the text of the latest revision of the page json object `r`."""
+    return r["revisions"][0]["slots"]["main"]["content"] if "revisions" in r else ""
+
 
 class QConstant:
     """Template information for API queries.  Can generate query parameters to send and contains the result retreival function."""
 
-    def __init__(self, name: str, pl: dict = None, limit_key: str = None, retrieve_results: Callable[[Union[dict, list]], Any] = None):
+    __slots__ = ("name", "pl", "limit_key", "retrieve_results", "cacheable", "_pl_cache")
+
+    def __init__(self, name: str, pl: dict = None, limit_key: str = None, retrieve_results: Callable[[Union[dict, list]], Any] = None, cacheable: bool = True):
         """Initializer, creates a new QConstant.
 
         Args:
@@ -19,11 +98,23 @@ class QConstant:
             pl (dict, optional): Additional parameters to send, excluding the limit key. Defaults to None.
             limit_key (str, optional): The limit key associated with this query, if applicable. Defaults to None.
             retrieve_results (Callable[[Union[dict, list]], Any], optional): The function to retrieve values from the server's response.  Varies between `prop`/`list` queries.  If not set, will use the default `prop` retrieval function. Defaults to None.
+            cacheable (bool, optional): Set `False` if identical queries made with this QConstant may return different results (e.g. random pages), which means their responses must never be cached or shared.  Defaults to True.
         """
         self.name = name
         self.pl = pl or {}
         self.limit_key = limit_key
-        self.retrieve_results = retrieve_results or (lambda l: [e["title"] for e in l])
+        self.retrieve_results = retrieve_results or _titles
+        self.cacheable = cacheable
+
+        self._pl_cache = {MAX: self._build_pl(MAX)}
+
+    def __repr__(self) -> str:
+        """Creates a str representation of this QConstant.  Useful for debugging, and for printing results keyed by QConstant.
+
+        Returns:
+            str: The str representation of this QConstant.
+        """
+        return f"QConstant(name={self.name!r}, pl={self.pl!r})"
 
     def pl_with_limit(self, limit_value: Union[int, str] = MAX) -> dict:
         """Get the parameter list (`self.pl`) for this QConstant and include this QConstant's `self.limit_key` and the specified `limit_value` if possible.
@@ -34,6 +125,23 @@ class QConstant:
         Returns:
             dict: A new parameter wtih the key-value pairs in `self.pl` and a `limit_key` and `limit_value` as specified.
         """
+        if (pl := self._pl_cache.get(limit_value)) is None:
+            pl = self._pl_cache[limit_value] = self._build_pl(limit_value)
+
+        return pl.copy()
+
+    def _build_pl(self, limit_value: Union[int, str]) -> dict:
+        """Builds the parameter list returned by `pl_with_limit()`.  Computed once per distinct `limit_value` and cached on this QConstant.
+
+        Args:
+            limit_value (Union[int, str]): The limit value to associate with this QConstant's `self.limit_key`.
+
+        Returns:
+            dict: A new parameter list with the key-value pairs in `self.pl` and a `limit_key` and `limit_value` as specified.
+        """
+        if not self.pl:
+            return {self.limit_key: limit_value} if self.limit_key and limit_value else {}
+
         pl = {**self.pl}
         if self.limit_key and limit_value:
             pl[self.limit_key] = limit_value
@@ -43,20 +151,20 @@ class QConstant:
 
 class PropNoCont:
     """Collection of QConstant objects which fulfill the page prop with no continuation strategy."""
-    EXISTS = QConstant("pageprops", {"ppprop": "missing"}, retrieve_results=lambda r: "missing" not in r)
-    CATEGORY_SIZE = QConstant("categoryinfo", retrieve_results=lambda r: mine_for(r, "categoryinfo", "size") or 0)
-    PAGE_TEXT = QConstant("revisions", {"rvprop": "content", "rvslots": "main"}, retrieve_results=lambda r: Revision(r["revisions"][0]).text if "revisions" in r else "")
+    EXISTS = QConstant("pageprops", {"ppprop": "missing"}, retrieve_results=_exists)
+    CATEGORY_SIZE = QConstant("categoryinfo", retrieve_results=_category_size)
+    PAGE_TEXT = QConstant("revisions", {"rvprop": "content", "rvslots": "main"}, retrieve_results=_page_text)
 
 
 class PropCont:
     """Collection of QConstant objects which fulfill the page prop with continuation strategy."""
     CATEGORIES = QConstant("categories", limit_key="cllimit")
-    DUPLICATE_FILES = QConstant("duplicatefiles", limit_key="dflimit", retrieve_results=lambda l: [e["name"] for e in l])
-    DUPLICATE_FILES_SHARED = QConstant("duplicatefiles", limit_key="dflimit", retrieve_results=lambda l: [e["name"] for e in l if e.get("shared")])
-    GLOBAL_USAGE = QConstant("globalusage", limit_key="gulimit", retrieve_results=lambda l: [(e["title"], e["wiki"]) for e in l])
-    EXTERNAL_LINKS = QConstant("extlinks", {"elexpandurl": 1}, "ellimit", lambda l: [e["url"] for e in l])
+    DUPLICATE_FILES = QConstant("duplicatefiles", limit_key="dflimit", retrieve_results=_names)
+    DUPLICATE_FILES_SHARED = QConstant("duplicatefiles", limit_key="dflimit", retrieve_results=_shared_names)
+    GLOBAL_USAGE = QConstant("globalusage", limit_key="gulimit", retrieve_results=_title_wiki_pairs)
+    EXTERNAL_LINKS = QConstant("extlinks", {"elexpandurl": 1}, "ellimit", _urls)
     FILEUSAGE = QConstant("fileusage", limit_key="fulimit")
-    IMAGE_INFO = QConstant("imageinfo", {"iiprop": "comment|sha1|size|timestamp|url|user"}, "iilimit", lambda l: [ImageInfo(e) for e in l])
+    IMAGE_INFO = QConstant("imageinfo", {"iiprop": "comment|sha1|size|timestamp|url|user"}, "iilimit", _image_infos)
     IMAGES = QConstant("images", limit_key="imlimit")
     LINKS_HERE = QConstant("linkshere", limit_key="lhlimit")
     TEMPLATES = QConstant("templates", limit_key="tllimit")
@@ -66,19 +174,19 @@ class PropCont:
 
 class PropContSingle:
     """Collection of QConstant objects which fulfill the prop cont single strategy."""
-    DELETED_REVISIONS = QConstant("deletedrevisions", {"drvslots": "main"}, "drvlimit", lambda l: [Revision(e) for e in l])
-    REVISIONS = QConstant("revisions", {"rvslots": "main"}, "rvlimit", lambda l: [Revision(e) for e in l])
+    DELETED_REVISIONS = QConstant("deletedrevisions", {"drvslots": "main"}, "drvlimit", _revisions)
+    REVISIONS = QConstant("revisions", {"rvslots": "main"}, "rvlimit", _revisions)
 
 
 class ListCont:
     """Collection of QConstant objects which fulfill the list cont strategy."""
-    ALL_USERS = QConstant("allusers", limit_key="aulimit", retrieve_results=lambda l: [e["name"] for e in l])
+    ALL_USERS = QConstant("allusers", limit_key="aulimit", retrieve_results=_names)
     CATEGORY_MEMBERS = QConstant("categorymembers", limit_key="cmlimit")
-    CONTRIBS = QConstant("usercontribs", limit_key="uclimit", retrieve_results=lambda l: [Contrib(e) for e in l])
-    DUPLICATE_FILES = QConstant("querypage", {"qppage": "ListDuplicatedFiles"}, "qplimit", lambda q: [e["title"] for e in q["results"]])
-    LOGS = QConstant("logevents", {"leprop": "title|type|user|timestamp|comment|tags"}, "lelimit", lambda l: [Log(e) for e in l])
+    CONTRIBS = QConstant("usercontribs", limit_key="uclimit", retrieve_results=_contribs)
+    DUPLICATE_FILES = QConstant("querypage", {"qppage": "ListDuplicatedFiles"}, "qplimit", _query_page_titles)
+    LOGS = QConstant("logevents", {"leprop": "title|type|user|timestamp|comment|tags"}, "lelimit", _logs)
     PREFIX_INDEX = QConstant("allpages", limit_key="aplimit")
-    RANDOM = QConstant("random", {"rnfilterredir": "nonredirects"}, "rnlimit")
+    RANDOM = QConstant("random", {"rnfilterredir": "nonredirects"}, "rnlimit", cacheable=False)
     SEARCH = QConstant("search", {"srprop": ""}, "srlimit")
-    STASHED_FILES = QConstant("mystashedfiles", {"msfprop": "size"}, "msflimit", lambda l: [(e["filekey"], e["size"], e["status"]) for e in l])
+    STASHED_FILES = QConstant("mystashedfiles", {"msfprop": "size"}, "msflimit", _stashed_files, False)
     USER_UPLOADS = QConstant("allimages", {"aisort": "timestamp"}, "ailimit")
@@ -3,54 +3,155 @@ from __future__ import annotations
 
 import logging
 
-from collections.abc import Generator, Iterable
-from itertools import chain
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future
+from itertools import chain, islice
+from threading import Lock
+from time import monotonic
 from typing import TYPE_CHECKING, TypeVar, Union
 
-from .utils import has_error, make_params, mine_for, read_error
+from .utils import has_error, make_params, read_error, read_json
 
 if TYPE_CHECKING:
+    from requests import Response
+
     from .wiki import Wiki
 
 T = TypeVar('T')
 
+_QUERY_CACHE_MAX = 1024
+
+_CACHE_LOCK = Lock()
+_INFLIGHT_LOCK = Lock()
+_inflight: dict[tuple, Future] = {}
+
 log = logging.getLogger(__name__)
 
 
-def basic_query(wiki: Wiki, pl: dict, big_query: bool = False) -> dict:
-    """Performs a query action and returns the response from the server as json.
+def _send_query(wiki: Wiki, p: dict, big_query: bool) -> Response:
+    """Sends a query to the server.  Does no caching or request de-duplication, see `basic_query()`.
 
     Args:
         wiki (Wiki): The Wiki object to use
-        pl (dict): The parameter list to send.  Do not include `{"action": "query"}`, this pair will be automatically included.
-        big_query (bool, optional): Indicates if the query could be large, in which case a `POST` will be performed instead.  Defaults to False.
+        p (dict): The full parameter list to send, as created by `make_params()`.
+        big_query (bool): Set `True` to perform a `POST` instead of a `GET`.
 
     Returns:
-         dict: The response from the server.  Empty dict if something went wrong
+        Response: The response from the server.  `None` if the server could not be reached.
     """
-    p = make_params("query", pl)
     try:
-        return (wiki.client.post(wiki.endpoint, data=p) if big_query else wiki.client.get(wiki.endpoint, params=p)).json()
+        return wiki.client.post(wiki.endpoint, data=p) if big_query else wiki.client.get(wiki.endpoint, params=p)
     except Exception:
-        log.error("%s: Could not reach server or read response while performing a (big_query: %s) query with params: %s", wiki, big_query, p, exc_info=True)
+        log.error("%s: Could not reach server while performing a (big_query: %s) query with params: %s", wiki, big_query, p, exc_info=True)
+
+
+def _read_response(wiki: Wiki, p: dict, response: Response) -> dict:
+    """Parses the response to a query as json.  The response itself is never modified, so every call returns a new dict.
+
+    Args:
+        wiki (Wiki): The Wiki object to use
+        p (dict): The full parameter list that was sent, as created by `make_params()`.  Only used for logging.
+        response (Response): The response from the server, as returned by `_send_query()`.
+
+    Returns:
+        dict: The parsed response.  Empty dict if `response` is `None` or could not be parsed.
+    """
+    if response is not None:
+        try:
+            return read_json(response)
+        except Exception:
+            log.error("%s: Could not read the server's response to a query with params: %s", wiki, p, exc_info=True)
 
     return {}
 
 
-def chunker(l: Iterable[T], size: int) -> tuple[T, ...]:
-    """Divides the input Iterable, `l`, into equal sub-lists of size, `size`.  Any remainder will be in the last element.
+def _cache_key(p: dict) -> frozenset:
+    """Creates the key that the response to a query is cached and shared under.
 
     Args:
-        l (Iterable[T]): The input Iterable
-        size (int): The maximum size of the sub-lists
+        p (dict): The full parameter list of the query, as created by `make_params()`.
+
+    Returns:
+        frozenset: The key for `p`, or `None` if `p` contains values which cannot be hashed.
+    """
+    try:
+        return frozenset(p.items())
+    except TypeError:
+        return None
+
+
+def clear_query_cache(wiki: Wiki) -> None:
+    """Discards all cached query responses of `wiki`.
+
+    Args:
+        wiki (Wiki): The Wiki object to use
+    """
+    with _CACHE_LOCK:
+        wiki._query_cache.clear()
+
+
+def basic_query(wiki: Wiki, pl: dict, big_query: bool = False, cacheable: bool = False) -> dict:
+    """Performs a query action and returns the response from the server as json.  If `cacheable` is `True` and `wiki.query_cache_ttl` is set, then identical `GET` queries made concurrently (e.g. from several threads) with the same Wiki also share a single request to the server.
+
+    Args:
+        wiki (Wiki): The Wiki object to use
+        pl (dict): The parameter list to send.  Do not include `{"action": "query"}`, this pair will be automatically included.
+        big_query (bool, optional): Indicates if the query could be large, in which case a `POST` will be performed instead.  `POST` queries are never cached.  Defaults to False.
+        cacheable (bool, optional): Set `True` if the response only depends on `pl` and the content of the wiki, and may therefore be cached and shared.  Leave `False` for queries whose results may differ between identical calls (e.g. random pages, tokens, stashed files).  Defaults to False.
 
     Returns:
-        tuple: The output tuple containing all the sub-lists derived from `l`.
+         dict: The response from the server.  Empty dict if something went wrong.  If `wiki.query_cache_ttl` is set, this may be parsed from the cached response to an identical query.
     """
-    if not isinstance(l, (list, tuple)):
-        l = list(l)
+    p = make_params("query", pl)
+
+    if not cacheable or big_query or wiki.query_cache_ttl <= 0 or (key := _cache_key(p)) is None:
+        return _read_response(wiki, p, _send_query(wiki, p, big_query))
+
+    if (entry := wiki._query_cache.get(key)) and monotonic() - entry[0] < wiki.query_cache_ttl:
+        return _read_response(wiki, p, entry[1])
+
+    with _INFLIGHT_LOCK:
+        if is_owner := (future := _inflight.get(flight_key := (id(wiki), key))) is None:
+            future = _inflight[flight_key] = Future()
+
+    if not is_owner:
+        return _read_response(wiki, p, future.result())
+
+    try:
+        raw = _send_query(wiki, p, False)  # cached and shared as is, each caller parses its own copy so callers are free to modify what they get back
+        response = _read_response(wiki, p, raw)
+
+        if response and not has_error(response):
+            with _CACHE_LOCK:
+                wiki._query_cache.pop(key, None)  # re-insert so the oldest entries stay at the front
+                wiki._query_cache[key] = (monotonic(), raw)
+
+                if len(wiki._query_cache) > _QUERY_CACHE_MAX:
+                    del wiki._query_cache[next(iter(wiki._query_cache))]
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _inflight[flight_key]
+
+    future.set_result(raw)
+    return response
+
+
+def chunker(l: Iterable[T], size: int) -> Generator[list[T], None, None]:
+    """Divides the input Iterable, `l`, into equal sub-lists of size, `size`.  Any remainder will be in the last element.  Elements are read from `l` lazily, so `l` is never copied in its entirety.
+
+    Args:
+        l (Iterable[T]): The input Iterable
+        size (int): The maximum size of the sub-lists
 
-    return (l[pos:pos + size] for pos in range(0, len(l), size))
+    Yields:
+        Generator[list[T], None, None]: A Generator which yields the sub-lists derived from `l`.
+    """
+    it = iter(l)
+    while chunk := list(islice(it, size)):
+        yield chunk
 
 
 def denormalize_result(d: dict, response: dict, target_class: Union[type[list], type[dict], None] = None) -> None:
@@ -64,23 +165,20 @@ def denormalize_result(d: dict, response: dict, target_class: Union[type[list],
     Raises:
         TypeError: If `target_class` was set to something other than `list` or `dict`.
     """
-    if normalized := mine_for(response, "query", "normalized"):
-        for e in normalized:
-            new = d.pop(e["to"])
-
-            if target_class:
-                existing = d[e["from"]] if e["from"] in d else target_class()
-
-                if target_class == list:
-                    existing += new
-                elif target_class == dict:
-                    existing |= new
-                else:
-                    raise TypeError("%s is not a supported data structure for denormalization", target_class)
-            else:
-                existing = new
+    if not (normalized := extract_body("normalized", response)):
+        return
 
-            d[e["from"]] = existing
+    if target_class is None:
+        for e in normalized:
+            d[e["from"]] = d.pop(e["to"])
+    elif target_class is list:
+        for e in normalized:
+            d.setdefault(e["from"], []).extend(d.pop(e["to"]))
+    elif target_class is dict:
+        for e in normalized:
+            d.setdefault(e["from"], {}).update(d.pop(e["to"]))
+    else:
+        raise TypeError(f"{target_class} is not a supported data structure for denormalization")
 
 
 def extract_body(id: str, response: dict) -> Union[dict, list]:
@@ -91,9 +189,9 @@ def extract_body(id: str, response: dict) -> Union[dict, list]:
         response (dict): The response from the server.
 
     Returns:
-        Union[dict, list]: the contents under `"query"` -> `id`.
+        Union[dict, list]: the contents under `"query"` -> `id`.  `None` if this could not be found.
     """
-    return mine_for(response, "query", id)
+    return q.get(id) if response and (q := response.get("query")) else None
 
 
 def flatten_generator(g: Generator[list, None, None]) -> list:
@@ -105,7 +203,24 @@ def flatten_generator(g: Generator[list, None, None]) -> list:
     Returns:
         list: The flattened list of lists yielded by the generator.
     """
-    return list(chain.from_iterable(g))
+    out = []
+    extend = out.extend
+    for chunk in g:
+        extend(chunk)
+
+    return out
+
+
+def flatten_iter(g: Generator[list[T], None, None]) -> Iterator[T]:
+    """Lazily flattens the lists yielded by a generator.  Unlike `flatten_generator()`, the generator is only advanced as the returned Iterator is consumed.
+
+    Args:
+        g (Generator[list[T], None, None]): The generator to read from.
+
+    Returns:
+        Iterator[T]: An Iterator over the elements of each list yielded by the generator.
+    """
+    return chain.from_iterable(g)
 
 
 def get_continue_params(response: dict) -> dict:
@@ -120,7 +235,7 @@ def get_continue_params(response: dict) -> dict:
     return response.get("continue", {})
 
 
-def query_and_validate(wiki: Wiki, pl: dict, big_query: bool = False, desc: str = "perform query") -> dict:
+def query_and_validate(wiki: Wiki, pl: dict, big_query: bool = False, desc: str = "perform query", cacheable: bool = False) -> dict:
     """Performs a `basic_query()` and checks the results for errors.  If there is an error, it will be logged accordingly.
 
     Args:
@@ -128,11 +243,12 @@ def query_and_validate(wiki: Wiki, pl: dict, big_query: bool = False, desc: str
         pl (dict): The parameter list to send.  Do not include `{"action": "query"}`, this pair will be automatically included.
         big_query (bool, optional): Indicates if the query could be large, in which case a `POST` will be performed instead.  Defaults to False.
         desc (str, optional): A few words describing what this query was trying to accomplish.  This will be displayed in the logs if there was an error. Defaults to "perform query".
+        cacheable (bool, optional): Set `True` if the response may be cached and shared, see `basic_query()`.  Defaults to False.
 
     Returns:
         dict: The response from the server.  `None` if something went wrong.
     """
-    if not (response := basic_query(wiki, pl, big_query)):
+    if not (response := basic_query(wiki, pl, big_query, cacheable)):
         log.error("%s: No response from server while trying to %s", wiki, desc)
         log.debug("Sent parameters: %s", pl)
         return
@@ -1,12 +1,23 @@
 """Shared utilities and constants"""
 import logging
 
-from contextlib import suppress
+from types import MappingProxyType
 from typing import Any
 
-API_DEFAULTS = {"format": "json", "formatversion": "2"}
+from requests import Response
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional, fall back to the standard library
+    from json import loads as _loads
+
+API_DEFAULTS = MappingProxyType({"format": "json", "formatversion": "2"})  # read-only, make_params() caches dicts derived from this
 PROP_TITLE_MAX = 50
 PROP_TITLE_MAX_BOT = 500
+UPLOAD_CHUNK_SIZE = 1024 * 1024 * 4
+
+_ACTION_DEFAULTS: dict[str, dict] = {}
+_MISSING = object()
 
 log = logging.getLogger(__name__)
 
@@ -28,12 +39,15 @@ def make_params(action: str, pl: dict = None) -> dict:
 
     Args:
         action (str): The action value (e.g. "query", "edit", "purge")
-        pl (dict, optional): Additional parameters besides the defaults in _API_DEFAULTS and the action parameter. Defaults to None.
+        pl (dict, optional): Additional parameters besides the defaults in API_DEFAULTS and the action parameter. Defaults to None.
 
     Returns:
         dict: A new dict with the parameters
     """
-    return {**API_DEFAULTS, **(pl or {}), "action": action}
+    if (base := _ACTION_DEFAULTS.get(action)) is None:
+        base = _ACTION_DEFAULTS[action] = API_DEFAULTS | {"action": action}
+
+    return {**base, **pl, "action": action} if pl else base.copy()  # action always wins over any "action" key in pl
 
 
 def mine_for(target: dict, *keys: str) -> Any:
@@ -46,13 +60,11 @@ def mine_for(target: dict, *keys: str) -> Any:
     Returns:
         Any: Whatever value is found at the end of following the specified keys.  `None` if nothing was not found.
     """
-    try:
-        for k in keys:
-            target = target.get(k, {})
+    for k in keys:
+        if not isinstance(target, dict) or (target := target.get(k, _MISSING)) is _MISSING:
+            return None
 
-        return target if target != {} else None
-    except Exception:
-        log.debug("Crash in mine_for(), something must have gone *terribly* wrong", exc_info=True)
+    return target
 
 
 def read_error(action: str, response: dict) -> tuple[str, str]:
@@ -65,13 +77,24 @@ def read_error(action: str, response: dict) -> tuple[str, str]:
     Returns:
         tuple[str, str]: A tuple such that the first element is the status code and the second element is the error description.
     """
-    with suppress(Exception):
-        if has_error(response):
-            return response["error"]["code"], response["error"]["info"]
-        elif action in response:
-            return response[action]["result"], response[action]["reason"]
+    if isinstance(error := response.get("error"), dict):
+        return error.get("code"), error.get("info")
+    elif isinstance(result := response.get(action), dict) and "result" in result:
+        return result["result"], result.get("reason")
 
     log.warning("Unable to parse error which occurred while perfoming a '%s' action", action)
     log.debug(response)
 
     return (None,)*2
+
+
+def read_json(response: Response) -> Any:
+    """Parses the body of a response from the server as json.  Uses `orjson` if it is installed, which is considerably faster on large responses.
+
+    Args:
+        response (Response): The response from the server.
+
+    Returns:
+        Any: The parsed json.
+    """
+    return _loads(response.content)
@@ -5,24 +5,43 @@ import logging
 
 from collections.abc import Iterable
 from functools import partial
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
+from random import uniform
 from time import sleep
 from typing import TYPE_CHECKING
 
 from .dwrap import Revision
 from .ns import NS
 from .oquery import OQuery
-from .query_utils import chunker
-from .utils import has_error, make_params, mine_for, read_error
+from .query_utils import chunker, clear_query_cache
+from .utils import UPLOAD_CHUNK_SIZE, has_error, make_params, mine_for, read_error, read_json
+
+try:
+    from mmap import MADV_SEQUENTIAL
+except ImportError:  # madvise() is not available on Windows
+    MADV_SEQUENTIAL = None
 
 if TYPE_CHECKING:
     from .wiki import Wiki
 
-_CHUNKSIZE = 1024 * 1024 * 4
-
 log = logging.getLogger(__name__)
 
 
+def _backoff(tries: int, base: float, cap: float = 300) -> float:
+    """Computes how long to wait before the next retry, using exponential backoff with up to a second of random jitter so that concurrent clients don't retry in lockstep.
+
+    Args:
+        tries (int): The number of attempts that have failed so far, minus one.
+        base (float): The delay (in seconds) before the first retry.  Set 0 to disable waiting.
+        cap (float, optional): The maximum delay, in seconds. Defaults to 300.
+
+    Returns:
+        float: The number of seconds to wait.
+    """
+    return min(base * 2 ** tries + uniform(0, 1), cap) if base else 0
+
+
 class WAction:
     """Collection of functions which can perform write actions on a Wiki"""
 
@@ -42,7 +61,23 @@ class WAction:
         Returns:
             dict: The json response from the server, or `None` if something went wrong.
         """
-        if not (response := WAction._post_action(wiki, action, form, apply_token, timeout, extra_args)):
+        return WAction._validate_action(wiki, action, WAction._post_action(wiki, action, form, apply_token, timeout, extra_args), form, success_vals)
+
+    @staticmethod
+    def _validate_action(wiki: Wiki, action: str, response: dict, form: dict = None, success_vals: tuple = ("Success",)) -> dict:
+        """Checks the response to an action for errors.  If there is an error, it will be logged accordingly.
+
+        Args:
+            wiki (Wiki): The Wiki object to use
+            action (str): The id of the action that was performed.
+            response (dict): The response returned by `_post_action()`.
+            form (dict, optional): The parameters that were POSTed to the server, if applicable.  Only used for logging.  Defaults to None.
+            success_vals (tuple, optional): The keyword responses returned by the server which indicate a successful action.  Optional, set `None` to skip this check.  Defaults to ("Success",).
+
+        Returns:
+            dict: `response`, or `None` if something went wrong.
+        """
+        if not response:
             log.error("%s: No response from server while trying to perform action '%s'", wiki, action)
             log.debug("Sent parameters: %s", form)
             return
@@ -73,10 +108,18 @@ class WAction:
         Returns:
             dict: The response from the server.  Empty dict if there was an error.
         """
-        pl = make_params(action, form) | ({"token": wiki.csrf_token} if apply_token else {})
+        pl = make_params(action, form)
+        if apply_token:
+            pl["token"] = wiki.csrf_token
+
+        kwargs = {"timeout": timeout}
+        if extra_args:
+            kwargs.update(extra_args)
+
+        clear_query_cache(wiki)  # actions may change what queries return
 
         try:
-            return wiki.client.post(wiki.endpoint, data=pl, **({"timeout": timeout} | (extra_args or {}))).json()
+            return read_json(wiki.client.post(wiki.endpoint, data=pl, **kwargs))
         except Exception:
             log.error("%s: Could not reach server or read response while performing %s with params %s", wiki, action, pl, exc_info=True)
 
@@ -149,9 +192,9 @@ class WAction:
         if not (response := WAction._action_and_validate(wiki, "login", {"lgname": username, "lgpassword": password, "lgtoken": OQuery.fetch_token(wiki, True)}, False)):
             return False
 
-        wiki.username = mine_for(response, "login", "lgusername")
-        wiki.csrf_token = OQuery.fetch_token(wiki)
-        wiki._refresh_rights()
+        wiki.username = response["login"]["lgusername"]  # safe, _action_and_validate() already verified the login result
+        wiki.csrf_token, _, rights, wiki.ns_manager = OQuery.fetch_session_info(wiki)
+        wiki._refresh_rights(rights)
         wiki.is_logged_in = True
 
         return True
@@ -197,24 +240,32 @@ class WAction:
             desc (str, optional): The text to go on the file description page. Defaults to "".
             summary (str, optional): The upload log summary to use. Defaults to "".
             max_retries (int, optional): The maximum number of retry in the event of failure (assuming the server expereinced an error). Defaults to 5.
-            retry_interval (int, optional): The number of seconds to wait in between retries.  Set 0 to disable. Defaults to 30.
+            retry_interval (int, optional): The number of seconds to wait before the first retry.  The wait doubles (with jitter) after each subsequent failure.  Set 0 to disable. Defaults to 30.
 
         Returns:
             bool: True if unstashing was successful
         """
         log.info("%s: Unstashing '%s' as '%s'", wiki, filekey, title)
 
-        tries = 0
-        status = False
-        while tries < max_retries and not (status := bool(WAction._action_and_validate(wiki, "upload", {"filename": title, "text": desc, "comment": summary, "filekey": filekey, "ignorewarnings": 1}, timeout=360)) or wiki.exists(wiki.convert_ns(title, NS.FILE))):
-            log.warning("%s: Unstash failed, this is a attempt %d of %d. Sleeping %ds...", wiki, tries + 1, max_retries, retry_interval)
-            sleep(retry_interval)
-            tries += 1
+        form = {"filename": title, "text": desc, "comment": summary, "filekey": filekey, "ignorewarnings": 1}
+        file_title = wiki.convert_ns(title, NS.FILE)
+
+        for tries in range(max_retries):
+            if WAction._validate_action(wiki, "upload", response := WAction._post_action(wiki, "upload", form, timeout=360), form):
+                return True
+
+            if not response and wiki.exists(file_title):  # no reply (e.g. timeout, 5xx), the file may have been published anyway
+                return True
 
-        return status
+            if tries + 1 < max_retries:
+                delay = _backoff(tries, retry_interval)
+                log.warning("%s: Unstash failed, this is a attempt %d of %d. Sleeping %.1fs...", wiki, tries + 1, max_retries, delay)
+                sleep(delay)
+
+        return False
 
     @staticmethod
-    def upload_only(wiki: Wiki, path: Path, title: str, max_retries: int = 5) -> str:
+    def upload_only(wiki: Wiki, path: Path, title: str, max_retries: int = 5, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
         """Uploads a file to the target Wiki.  Note: you will need to unstash (publish) your uploads post-upload in order for them to be visible on the wiki.
 
         Args:
@@ -222,27 +273,37 @@ class WAction:
             path (Path): The local path on your computer pointing to the file to upload
             title (str): The title to upload the file to, excluding the "`File:`" namespace.
             max_retries (int, optional): The maximum number of retry attempts in the event of an error. Defaults to 5.
+            chunk_size (int, optional): The size (in bytes) of each chunk to upload.  Larger chunks mean fewer round trips on fast connections, but must not exceed the wiki's maximum upload size.  Defaults to 4 MiB.
 
         Raises:
             OSError: if `path` does not exist or is an empty file.
+            ValueError: if `chunk_size` is not positive.
 
         Returns:
             str: the filekey, or `None` if something went wrong.
         """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, but was {chunk_size}")
+
         if not path.is_file() or not (fsize := path.stat().st_size):
             raise OSError(f"Nothing to upload, '{path}' does not exist or is an empty file.")
 
-        total_chunks = fsize // _CHUNKSIZE + 1
+        total_chunks = -(-fsize // chunk_size)
         pl = {"filename": title, "offset": 0, "ignorewarnings": 1, "filesize": fsize, "token": wiki.csrf_token, "stash": 1}
-        chunk_count = err_count = 0
+        err_count = 0
+
+        with path.open('rb') as f, mmap(f.fileno(), 0, access=ACCESS_READ) as mm, memoryview(mm) as view:
+            if MADV_SEQUENTIAL is not None:  # chunks are sent in order, so have the kernel read ahead aggressively
+                mm.madvise(MADV_SEQUENTIAL)
 
-        with path.open('rb') as f:
-            while buffer := f.read(_CHUNKSIZE):
-                log.info("%s: Uploading chunk %d of %d from '%s'", wiki, chunk_count+1, total_chunks, path)
+            while (offset := pl["offset"]) < fsize:
+                log.info("%s: Uploading chunk %d of %d from '%s'", wiki, offset // chunk_size + 1, total_chunks, path)
 
-                if (response := WAction._action_and_validate(wiki, "upload", pl, timeout=420, success_vals=("Continue", "Success"), extra_args={"files": {'chunk': (path.name, buffer, "multipart/form-data")}})) and (filekey := mine_for(response, "upload", "filekey")):
-                    chunk_count += 1
-                    pl["offset"] = _CHUNKSIZE * chunk_count
+                with view[offset:offset + chunk_size] as chunk:
+                    response = WAction._action_and_validate(wiki, "upload", pl, timeout=420, success_vals=("Continue", "Success"), extra_args={"files": {'chunk': (path.name, chunk, "multipart/form-data")}})
+
+                if response and (filekey := mine_for(response, "upload", "filekey")):
+                    pl["offset"] = offset + chunk_size
                     pl["filekey"] = filekey
                 else:
                     err_count += 1
@@ -251,12 +312,18 @@ class WAction:
                         log.error("%s: Exceeded error threshold, abort.", wiki)
                         return
 
-        if chunk_count == total_chunks - 1:  # a poorly configured MediaWiki installation may fail to acknowledge the final chunk, but we can attempt recovery on our end
+                    if offset + chunk_size >= fsize:  # the final chunk may have been received without being acknowledged, see below
+                        break
+
+                    sleep(_backoff(err_count - 1, 2))
+
+        if pl["offset"] < fsize:  # a poorly configured MediaWiki installation may fail to acknowledge the final chunk, but we can attempt recovery on our end
             for i in range(max_retries):
-                log.info("%s: Attempting to unmangle filekey, '%s'.  Attempt %d/%d, but first sleeping 30s...", wiki, pl["filekey"], i+1, max_retries)
-                sleep(30)
+                delay = _backoff(i, 30)
+                log.info("%s: Attempting to unmangle filekey, '%s'.  Attempt %d/%d, but first sleeping %.1fs...", wiki, pl.get("filekey"), i+1, max_retries, delay)
+                sleep(delay)
 
-                if t := next((e for e in wiki.stashed_files() if e[0] == pl["filekey"] or e[1] == fsize), None):
+                if t := next((e for e in wiki.stashed_files() if e[0] == pl.get("filekey") or e[1] == fsize), None):
                     if t[2] == "finished":
                         log.info("%s: Found a matching filekey: '%s'", wiki, t[0])
                         return t[0]
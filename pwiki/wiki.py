@@ -3,9 +3,11 @@
 import logging
 import pickle
 import re
+import weakref
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from platform import platform, python_version
 from os import environ
@@ -13,15 +15,17 @@ from typing import Any, Union
 from urllib.parse import urlparse
 
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from .dwrap import Contrib, ImageInfo, Log, Revision
 from .gquery import GQuery
 from .mquery import MQuery
-from .ns import MAIN_NAME, NS, NSManager
+from .ns import NS, NSManager
 from .oquery import OQuery
 from .query_constants import MAX
-from .query_utils import flatten_generator
-from .utils import PROP_TITLE_MAX, PROP_TITLE_MAX_BOT
+from .query_utils import flatten_iter
+from .utils import PROP_TITLE_MAX, PROP_TITLE_MAX_BOT, UPLOAD_CHUNK_SIZE
 from .waction import WAction
 from .wparser import WikiText, WParser
 
@@ -32,7 +36,7 @@ log = logging.getLogger(__name__)
 class Wiki:
     """General wiki-interfacing functionality and config data"""
 
-    def __init__(self, domain: str = "en.wikipedia.org", username: str = None, password: str = None, cookie_jar: Path = Path("."), api_endpoint: str = None):
+    def __init__(self, domain: str = "en.wikipedia.org", username: str = None, password: str = None, cookie_jar: Path = Path("."), api_endpoint: str = None, query_cache_ttl: float = 0):
         """Initializer, creates a new Wiki object.
 
         Args:
@@ -41,6 +45,7 @@ class Wiki:
             password (str, optional): The password to use when logging in. Does nothing if `username` is not set. Defaults to None.
             cookie_jar (Path, optional): The directory to save/read cookies to/from.  Disable by setting this to `None`.  Note that in order to save cookies you still have to call `self.save_cookies()`. Defaults to Path(".").
             api_endpoint (str, optional): The base API endpoint on your wiki.  This usually looks something like `https://<YOUR_DOMAIN>/w/api.php`.  Useful if your wiki uses a non-standard endpoint.  If set, `domain` will be ignored. Defaults to None.
+            query_cache_ttl (float, optional): The number of seconds to reuse the responses of identical `GET` queries for.  While enabled, identical queries made concurrently also share a single request.  The cache is cleared whenever this Wiki performs an action (e.g. edit, delete, login).  Queries whose results may differ between identical calls (e.g. random pages, tokens, stashed files) are never cached.  Set 0 to disable.  Defaults to 0.
 
         Raises:
             RuntimeError: If `username` and/or `password` was set and login failed.
@@ -50,21 +55,36 @@ class Wiki:
         self.client: Session = Session()
         self.client.headers.update({"User-Agent": f"pwiki/{platform()}/{python_version()}"})
 
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504), raise_on_status=False))
+        self.client.mount("https://", adapter)
+        self.client.mount("http://", adapter)
+        self._finalizer = weakref.finalize(self, self.client.close)
+
         self.username: str = None
         self.cookie_jar: Path = cookie_jar
         self.is_logged_in: bool = False
         self.csrf_token: str = "+\\"
 
+        self.query_cache_ttl: float = query_cache_ttl
+        self._query_cache: dict = {}
+        self._uploadable_filetypes: frozenset = None
+
         self._refresh_rights()
 
         if username and not (self._load_cookies(username) or self.login(username, password)):
             raise RuntimeError(f"Failed to login for '{username}'!")
 
-        self.ns_manager: NSManager = OQuery.fetch_namespaces(self)
+    def __enter__(self) -> "Wiki":
+        """Enters a `with` block, for deterministic cleanup of this Wiki's resources.
+
+        Returns:
+            Wiki: This Wiki object.
+        """
+        return self
 
-    def __del__(self) -> None:
-        """Finalizer, releases resources used by the internal requests session"""
-        self.client.close()
+    def __exit__(self, *args) -> None:
+        """Exits a `with` block, releases resources used by the internal requests session"""
+        self._finalizer()
 
     def __repr__(self) -> str:
         """Generate a str representation of this Wiki object.  Useful for logging.
@@ -74,17 +94,30 @@ class Wiki:
         """
         return f"[{self.username or '<Anonymous>'} @ {self.domain}]"
 
-    def _refresh_rights(self) -> None:
-        """Refreshes the cached user rights fields.  If not logged in, then set the user rights to the defaults (i.e. no rights)."""
+    def _refresh_rights(self, rights: list[str] = None) -> None:
+        """Refreshes the cached user rights fields.  If not logged in, then set the user rights to the defaults (i.e. no rights).
+
+        Args:
+            rights (list[str], optional): The rights of the logged in user, if these were already fetched from the server.  If `None`, then fetch them.  Defaults to None.
+        """
         if not self.username:
             self.rights: list = []
             self.is_bot: bool = False
             self.prop_title_max: int = PROP_TITLE_MAX
         else:
-            self.rights: list = self.list_user_rights()
+            self.rights: list = self.list_user_rights() if rights is None else rights
             self.is_bot: bool = "bot" in self.rights
             self.prop_title_max: int = PROP_TITLE_MAX_BOT if self.is_bot or "sysop" in self.rights else PROP_TITLE_MAX
 
+    @cached_property
+    def ns_manager(self) -> NSManager:
+        """The namespace manager of this Wiki.  Fetched from the server on first access, unless logging in already fetched it.
+
+        Returns:
+            NSManager: The namespace manager of this Wiki.
+        """
+        return OQuery.fetch_namespaces(self)
+
     ##################################################################################################
     ######################################## C O O K I E S ###########################################
     ##################################################################################################
@@ -112,20 +145,32 @@ class Wiki:
         Returns:
             bool: `True` if successful (confirmed with server that cookies are valid).
         """
-        if not (self.cookie_jar and (cookie_path := self._cookie_path(username)).is_file()):
+        if not self.cookie_jar:
             return False
 
-        with cookie_path.open('rb') as f:
-            self.client.cookies = pickle.load(f)
+        try:
+            with (cookie_path := self._cookie_path(username)).open('rb') as f:
+                cookies = pickle.load(f)
+        except OSError:
+            return False
 
-        self.csrf_token = OQuery.fetch_token(self)
+        if not isinstance(cookies, list):  # cookies saved by older versions of pwiki are a pickled RequestsCookieJar
+            log.warning("%s: '%s' is in an outdated format, ignoring it", self, cookie_path)
+            return False
+
+        self.client.cookies.clear()
+        for name, value, domain, path, expires, secure, rest in cookies:
+            self.client.cookies.set(name, value, domain=domain, path=path, expires=expires, secure=secure, rest=rest)
+
+        self.csrf_token, username, rights, ns_manager = OQuery.fetch_session_info(self)
         if self.csrf_token == "+\\":
             log.warning("Cookies loaded from '%s' are invalid!  Skipping cookies...", cookie_path)
             self.client.cookies.clear()
             return False
 
-        self.username = self.whoami()
-        self._refresh_rights()
+        self.username = username
+        self.ns_manager = ns_manager
+        self._refresh_rights(rights)
         self.is_logged_in = True
 
         log.debug("%s: successfully loaded cookies from '%s'", self, cookie_path)
@@ -146,8 +191,10 @@ class Wiki:
             return
 
         (p := self._cookie_path()).parent.mkdir(parents=True, exist_ok=True)
-        with p.open('wb') as f:
-            pickle.dump(self.client.cookies, f)
+        with (tmp := p.with_name(p.name + ".tmp")).open('wb') as f:
+            pickle.dump([(c.name, c.value, c.domain, c.path, c.expires, c.secure, c._rest) for c in self.client.cookies], f, pickle.HIGHEST_PROTOCOL)
+
+        tmp.replace(p)  # atomic, so an interrupted save never leaves behind a truncated cookie file
 
         log.info("%s: Saved cookies to '%s'", self, p)
 
@@ -176,8 +223,9 @@ class Wiki:
         Returns:
             list[str]: A copy of `titles` with any titles in `nsl` excluded.
         """
-        nsl = {self.ns_manager.stringify(ns) for ns in nsl}
-        return [s for s in titles if self.which_ns(s) in nsl]
+        ids, which_ns = self.ns_manager.m.get, self.ns_manager.which_ns  # bound once, this may be called with very large lists
+        nsl = {self.ns_manager.intify(ns) for ns in nsl} - {None}
+        return [s for s in titles if ids(which_ns(s)) in nsl]
 
     def in_ns(self, title: str, ns: Union[int, NS, str, tuple[Union[int, NS, str]]]) -> bool:
         """Checks if a title belongs to a namespace or namespaces.  This is a lexical operation only, so `title` must be well-formed.
@@ -189,8 +237,9 @@ class Wiki:
         Returns:
             bool: True if `title` is a member of the namespace(s), `ns`.
         """
-        target = self.ns_manager.intify(self.which_ns(title))
-        return (target in {self.ns_manager.intify(x) for x in ns}) if isinstance(ns, tuple) else (target == self.ns_manager.intify(ns))
+        intify = self.ns_manager.intify
+        target = intify(self.which_ns(title))
+        return any(target == intify(x) for x in ns) if isinstance(ns, tuple) else target == intify(ns)
 
     def is_talk_page(self, title: str) -> bool:
         """Determines if `title` is part of a talk page namespace.  This is a lexical operation and does not perform an api query.
@@ -201,7 +250,7 @@ class Wiki:
         Returns:
             bool: `True` if `title` is a talk page.
         """
-        return (id := self.ns_manager.intify(self.which_ns(title))) >= 0 and id % 2
+        return self.ns_manager.m.get(self.which_ns(title)) in self.ns_manager.talk_ids
 
     def not_in_ns(self, title: str, ns: Union[int, NS, str, tuple[Union[int, NS, str]]]) -> bool:
         """Checks if a title does not belong to a namespace or namespaces.  This is a lexical operation only, so `title` must be well-formed.
@@ -235,10 +284,10 @@ class Wiki:
         Returns:
             str: The content page associated with `title`, or `None` if `title` is already a content page.
         """
-        if (ns_id := self.ns_manager.m.get(self.which_ns(title))) % 2:  # == 1
-            return self.ns_manager.canonical_prefix(self.ns_manager.m.get(ns_id - 1)) + self.nss(title)
+        if (ns_id := self.ns_manager.m.get(self.which_ns(title))) in self.ns_manager.talk_ids:
+            return self.ns_manager.prefix_by_id.get(ns_id - 1, "") + self.nss(title)
 
-        log.debug("%s: could not get page of '%s' because it is not a talk page and has an id of %d", self, title, ns_id)
+        log.debug("%s: could not get page of '%s' because it is not a talk page and has an id of %s", self, title, ns_id)
 
     def talk_page_of(self, title: str) -> str:
         """Gets the talk page of `title`.  If `title` is a talk page, then `None` will be returned.
@@ -247,12 +296,14 @@ class Wiki:
             title (str): The talk page associated with `title`.
 
         Returns:
-            str: The talk page of `title`, or `None` if `title` is already a talk page.
+            str: The talk page of `title`, or `None` if `title` is already a talk page or its namespace has no talk namespace.
         """
-        if (ns_id := self.ns_manager.m.get(self.which_ns(title))) % 2 == 0:
-            return f"{self.ns_manager.m.get(ns_id + 1)}:{self.nss(title)}"
-
-        log.debug("%s: could not get talk page of '%s' because it is already a talk page with an id of %d", self, title, ns_id)
+        if (ns_id := self.ns_manager.m.get(self.which_ns(title))) is None or ns_id % 2:
+            log.debug("%s: could not get talk page of '%s' because it is already a talk page with an id of %s", self, title, ns_id)
+        elif ns_id < 0 or (prefix := self.ns_manager.prefix_by_id.get(ns_id + 1)) is None:  # e.g. Media has an id of -2, but no talk namespace
+            log.debug("%s: could not get talk page of '%s' because namespace %s has no talk namespace", self, title, ns_id)
+        else:
+            return prefix + self.nss(title)
 
     def which_ns(self, title: str) -> str:
         """Determines which namespace a title belongs to.
@@ -263,7 +314,7 @@ class Wiki:
         Returns:
             str: The namespace, without it's `:` suffix.  If main namespace, then `"Main"` will be returned
         """
-        return result[0][:-1] if (result := self.ns_manager.ns_regex.match(title)) else MAIN_NAME
+        return self.ns_manager.which_ns(title)
 
     ##################################################################################################
     ######################################## A C T I O N S ###########################################
@@ -363,7 +414,7 @@ class Wiki:
         log.info("%s: Restoring '%s'...", self, title)
         return WAction.undelete(self, title, reason, revs)
 
-    def upload(self, path: Path, title: str, desc: str = "", summary: str = "", max_retries=5) -> bool:
+    def upload(self, path: Path, title: str, desc: str = "", summary: str = "", max_retries=5, chunk_size: int = UPLOAD_CHUNK_SIZE) -> bool:
         """Uploads a file to the target Wiki.
 
         Args:
@@ -372,12 +423,16 @@ class Wiki:
             desc (str, optional): The text to go on the file description page.  Defaults to "".
             summary (str, optional): The upload log summary to use.  Defaults to "".
             max_retries (int, optional): The maximum number of retry attempts in the event of an error. Defaults to 5.
+            chunk_size (int, optional): The size (in bytes) of each chunk to upload.  Larger chunks mean fewer round trips on fast connections, but must not exceed the wiki's maximum upload size.  Defaults to 4 MiB.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
 
         Returns:
             bool: `True` if the upload was successful.
         """
         log.info("%s: Uploading '%s' to '%s'", self, path, title)
-        return WAction.unstash(self, filekey, title, desc, summary, max_retries) if (filekey := WAction.upload_only(self, path, title, max_retries)) else False
+        return WAction.unstash(self, filekey, title, desc, summary, max_retries) if (filekey := WAction.upload_only(self, path, title, max_retries, chunk_size)) else False
 
     ##################################################################################################
     ######################################## Q U E R I E S ###########################################
@@ -404,7 +459,7 @@ class Wiki:
         Returns:
             list[str]: a `list` containing usernames (without the `User:` prefix) that match the specified crteria.
         """
-        return flatten_generator(GQuery.all_users(self, groups, MAX))
+        return list(self.iter_all_users(groups))
 
     def categories_on_page(self, title: str) -> list[str]:
         """Fetch the categories used on a page.
@@ -428,8 +483,7 @@ class Wiki:
         Returns:
             list[str]: a `list` containing `title`'s category members.
         """
-        log.info("%s: fetching category members of '%s'", self, title)
-        return flatten_generator(GQuery.category_members(self, title, ns if isinstance(ns, list) else [ns], MAX))
+        return list(self.iter_category_members(title, ns))
 
     def category_size(self, title: str) -> int:
         """Queries the wiki and gets the number of pages categorized in `title`.
@@ -454,8 +508,7 @@ class Wiki:
         Returns:
             list[Contrib]: The contributions of `user`.
         """
-        log.info("%s: fetching contributions of '%s'", self, user)
-        return flatten_generator(GQuery.contribs(self, user, older_first, ns, MAX))
+        return list(self.iter_contribs(user, older_first, ns))
 
     def deleted_revisions(self, title: str, older_first: bool = False, include_text: bool = False) -> list[Revision]:
         """Fetches all the deleted revisions of `title`.  Plan accordingly when querying pages that have many deleted revisions!  PRECONDITION: You must be logged in and have admin rights in order for this to work.
@@ -468,8 +521,7 @@ class Wiki:
         Returns:
             list[Revision]: A `list` containing the (deleted) `Revision` objects of `title`
         """
-        log.info("%s: Fetching deleted revisions of '%s'", self, title)
-        return flatten_generator(GQuery.deleted_revisions(self, title, MAX, older_first, include_text))
+        return list(self.iter_deleted_revisions(title, older_first, include_text))
 
     def duplicate_files(self, title: str, local_only: bool = True) -> list[str]:
         """Find dupliates of `title` if possible.
@@ -567,6 +619,104 @@ class Wiki:
         log.info("%s: determining what files are embedded on %s", self, title)
         return self._xq_simple(MQuery.images_on_page, title)
 
+    def iter_all_users(self, groups: Union[list[str], str] = []) -> Iterator[str]:
+        """Lazy version of `all_users()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `all_users()`.
+
+        Returns:
+            Iterator[str]: An `Iterator` of usernames (without the `User:` prefix) that match the specified crteria.
+        """
+        return flatten_iter(GQuery.all_users(self, groups, MAX))
+
+    def iter_category_members(self, title: str, ns: Union[list[Union[NS, str]], NS, str] = []) -> Iterator[str]:
+        """Lazy version of `category_members()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `category_members()`.
+
+        Returns:
+            Iterator[str]: An `Iterator` of `title`'s category members.
+        """
+        log.info("%s: iterating over category members of '%s'", self, title)
+        return flatten_iter(GQuery.category_members(self, title, ns if isinstance(ns, list) else [ns], MAX))
+
+    def iter_contribs(self, user: str, older_first: bool = False, ns: list[Union[NS, str]] = []) -> Iterator[Contrib]:
+        """Lazy version of `contribs()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `contribs()`.
+
+        Returns:
+            Iterator[Contrib]: An `Iterator` of the contributions of `user`.
+        """
+        log.info("%s: iterating over contributions of '%s'", self, user)
+        return flatten_iter(GQuery.contribs(self, user, older_first, ns, MAX))
+
+    def iter_deleted_revisions(self, title: str, older_first: bool = False, include_text: bool = False) -> Iterator[Revision]:
+        """Lazy version of `deleted_revisions()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `deleted_revisions()`.  PRECONDITION: You must be logged in and have admin rights in order for this to work.
+
+        Returns:
+            Iterator[Revision]: An `Iterator` of the deleted `Revision` objects of `title`.
+        """
+        log.info("%s: iterating over deleted revisions of '%s'", self, title)
+        return flatten_iter(GQuery.deleted_revisions(self, title, MAX, older_first, include_text))
+
+    def iter_duplicate_files(self) -> Iterator[str]:
+        """Lazy version of `list_duplicate_files()`, which fetches more results from the server only as they are consumed.
+
+        Returns:
+            Iterator[str]: An `Iterator` of files that have duplicates on the wiki.
+        """
+        log.info("%s: iterating over files with duplicates from Special:ListDuplicatedFiles...", self)
+        return flatten_iter(GQuery.list_duplicate_files(self, MAX))
+
+    def iter_logs(self, title: str = None, log_type: str = None, log_action: str = None, user: str = None, ns: Union[NS, str] = None, tag: str = None, start: datetime = None, end: datetime = None, older_first: bool = False) -> Iterator[Log]:
+        """Lazy version of `logs()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `logs()`.  PRECONDITION: if `start` and `end` are both set, then `start` must occur before `end`.
+
+        Returns:
+            Iterator[Log]: An `Iterator` of `Log` objects that match the specified criteria.
+        """
+        log.info("%s: iterating over logs (%s, %s) for '%s'", self, log_type, log_action, title)
+        return flatten_iter(GQuery.logs(self, title, log_type, log_action, user, ns, tag, start, end, older_first, MAX))
+
+    def iter_prefix_index(self, ns: Union[NS, str], prefix: str) -> Iterator[str]:
+        """Lazy version of `prefix_index()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `prefix_index()`.
+
+        Returns:
+            Iterator[str]: An `Iterator` of titles that match the specified prefix index.
+        """
+        log.info("%s: iterating over prefix index for ns '%s' and prefix '%s'", self, ns, prefix)
+        return flatten_iter(GQuery.prefix_index(self, ns, prefix, MAX))
+
+    def iter_revisions(self, title: str, older_first: bool = False, start: datetime = None, end: datetime = None, include_text: bool = False) -> Iterator[Revision]:
+        """Lazy version of `revisions()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `revisions()`.  Prefer this over `revisions()` when you only need the first few revisions of a page with a long history.
+
+        Returns:
+            Iterator[Revision]: An `Iterator` of the `Revision` objects of `title`.
+        """
+        log.info("%s: iterating over revisions of '%s'", self, title)
+        return flatten_iter(GQuery.revisions(self, title, MAX, older_first, start, end, include_text))
+
+    def iter_search(self, phrase: str, ns: list[Union[NS, str]] = []) -> Iterator[str]:
+        """Lazy version of `search()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `search()`.
+
+        Returns:
+            Iterator[str]: An `Iterator` of the results of the search.
+        """
+        log.info("%s: iterating over search results for '%s'", self, phrase)
+        return flatten_iter(GQuery.search(self, phrase, ns, MAX))
+
+    def iter_stashed_files(self) -> Iterator[tuple[str, int, str]]:
+        """Lazy version of `stashed_files()`, which fetches more results from the server only as they are consumed.  PRECONDITION: You must be logged in for this to work
+
+        Returns:
+            Iterator[tuple[str, int, str]]: An `Iterator` of 3-`tuple` where each tuple is of the form (file key, file size, status).  Known values for status: `"finished"`, `"chunks"`
+        """
+        log.info("%s: iterating over user's stashed files...", self)
+        return flatten_iter(GQuery.stashed_files(self, MAX))
+
+    def iter_user_uploads(self, user: str) -> Iterator[str]:
+        """Lazy version of `user_uploads()`, which fetches more results from the server only as they are consumed.  Accepts the same arguments as `user_uploads()`.
+
+        Returns:
+            Iterator[str]: An `Iterator` of the files uploaded by `user`.
+        """
+        log.info("%s: iterating over uploads of '%s'", self, user)
+        return flatten_iter(GQuery.user_uploads(self, user, MAX))
+
     def last_editor_of(self, title: str) -> str:
         """Gets the user who most recently edited `title`.
 
@@ -597,8 +747,7 @@ class Wiki:
         Returns:
             list[str]: A `list` containing files that have duplicates on the wiki.
         """
-        log.info("%s: getting files with duplicates from Special:ListDuplicatedFiles...", self)
-        return flatten_generator(GQuery.list_duplicate_files(self, MAX))
+        return list(self.iter_duplicate_files())
 
     def list_user_rights(self, username: str = None) -> list[str]:
         """Lists user rights for the specified user.
@@ -629,8 +778,7 @@ class Wiki:
         Returns:
             list[Log]: A `list` of `Log` as specified.
         """
-        log.info("%s: Fetching logs...", self)
-        return flatten_generator(GQuery.logs(self, title, log_type, log_action, user, ns, tag, start, end, older_first, MAX))
+        return list(self.iter_logs(title, log_type, log_action, user, ns, tag, start, end, older_first))
 
     def normalize_title(self, title: str) -> str:
         """Normalizes titles to match their canonical versions.  Usually this means fixing capitalization or replacing underscores with spaces.
@@ -678,8 +826,7 @@ class Wiki:
         Returns:
             list[str]: A `list` containing files that match the specified prefix index.
         """
-        log.info("%s: Getting prefix index for ns '%s' and prefix '%s'", self, ns, prefix)
-        return flatten_generator(GQuery.prefix_index(self, ns, prefix, MAX))
+        return list(self.iter_prefix_index(ns, prefix))
 
     def random(self, ns: list[Union[NS, str]] = []) -> str:
         """Fetches a random page from the wiki.
@@ -717,8 +864,7 @@ class Wiki:
         Returns:
             list[Revision]: A `list` containing the `Revision` objects of `title`
         """
-        log.info("%s: Fetching revisions of '%s'", self, title)
-        return flatten_generator(GQuery.revisions(self, title, MAX, older_first, start, end, include_text))
+        return list(self.iter_revisions(title, older_first, start, end, include_text))
 
     def search(self, phrase: str, ns: list[Union[NS, str]] = []) -> list[str]:
         """Perform a search on the wiki.
@@ -730,8 +876,7 @@ class Wiki:
         Returns:
             list[str]: A `list` containing the results of the search.
         """
-        log.info("%s: Searching the wiki for '%s'", self, phrase)
-        return flatten_generator(GQuery.search(self, phrase, ns, MAX))
+        return list(self.iter_search(phrase, ns))
 
     def stashed_files(self) -> list[tuple[str, int, str]]:
         """Fetch the user's stashed files.  PRECONDITION: You must be logged in for this to work
@@ -739,8 +884,7 @@ class Wiki:
         Returns:
             list[tuple[str, int]]: a `list` of 3-`tuple` where each tuple is of the form (file key, file size, status).  Known values for status: `"finished"`, `"chunks"`
         """
-        log.info("%s: fetching user's stashed files...", self)
-        return flatten_generator(GQuery.stashed_files(self, MAX))
+        return list(self.iter_stashed_files())
 
     def templates_on_page(self, title: str) -> list[str]:
         """Fetch templates transcluded on a page.
@@ -760,8 +904,14 @@ class Wiki:
         Returns:
             set: A `set` containing all acceptable file types as their extensions (`.` prefix is not included)
         """
-        log.info("%s: Fetching a list of acceptable file upload extensions.", self)
-        return OQuery.uploadable_filetypes(self)
+        if self._uploadable_filetypes is None:  # site configuration, so only fetch this once
+            log.info("%s: Fetching a list of acceptable file upload extensions.", self)
+            if (filetypes := OQuery.uploadable_filetypes(self)) is None:
+                return None
+
+            self._uploadable_filetypes = frozenset(filetypes)
+
+        return set(self._uploadable_filetypes)
 
     def user_uploads(self, user: str) -> list[str]:
         """Gets the uploads of a user.
@@ -772,8 +922,7 @@ class Wiki:
         Returns:
             list[str]: A `list` containing the files uploaded by `user`.
         """
-        log.info("%s: Fetching uploads for '%s'", self, user)
-        return flatten_generator(GQuery.user_uploads(self, user, MAX))
+        return list(self.iter_user_uploads(user))
 
     def what_links_here(self, title: str, redirects_only: bool = False, ns: Union[list[Union[NS, str]], NS, str] = []) -> list[str]:
         """Fetch pages that wiki link (locally) to a page.
@@ -12,7 +12,7 @@ from xml.etree import ElementTree
 from .dwrap import Revision
 from .ns import NS
 from .oquery import OQuery
-from .utils import has_error, make_params, mine_for, read_error
+from .utils import has_error, make_params, mine_for, read_error, read_json
 
 if TYPE_CHECKING:
     from .wiki import Wiki
@@ -409,7 +409,7 @@ class WParser:
         """
         pl = make_params("parse", pl)
         try:
-            if not (response := (wiki.client.post(wiki.endpoint, data=pl) if big_query else wiki.client.get(wiki.endpoint, params=pl)).json()):
+            if not (response := read_json(wiki.client.post(wiki.endpoint, data=pl) if big_query else wiki.client.get(wiki.endpoint, params=pl))):
                 log.error("%s: No response from server while trying to %s", wiki, desc)
                 log.debug("Sent parameters: %s", pl)
                 return
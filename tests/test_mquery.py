@@ -2,6 +2,7 @@ from datetime import datetime
 
 from pwiki.mquery import MQuery
 from pwiki.ns import NS
+from pwiki.query_constants import PropNoCont
 
 from .base import WikiTestCase
 
@@ -24,6 +25,14 @@ class TestPropNoCont(WikiTestCase):
         expected = {"User:Fastily/Sandbox/HelloWorld": "Hello World!", "Category:Fastily Test": "jwiki unit testing!", "User:Fastily/NoPageHere": ""}
         self.assertDictEqual(expected, MQuery.page_text(self.wiki, list(expected.keys())))
 
+    def test_batch_prop_no_cont(self):
+        expected = {"Category:Fastily Test": {PropNoCont.EXISTS: True, PropNoCont.CATEGORY_SIZE: 4, PropNoCont.PAGE_TEXT: "jwiki unit testing!"},
+                    "User:Fastily/NoPageHere": {PropNoCont.EXISTS: False, PropNoCont.CATEGORY_SIZE: 0, PropNoCont.PAGE_TEXT: ""}}
+        self.assertDictEqual(expected, MQuery.batch_prop_no_cont(self.wiki, list(expected.keys()), [PropNoCont.EXISTS, PropNoCont.CATEGORY_SIZE, PropNoCont.PAGE_TEXT]))
+
+        with self.assertRaises(ValueError):
+            MQuery.batch_prop_no_cont(self.wiki, ["Main Page"], [PropNoCont.EXISTS, PropNoCont.EXISTS])
+
 
 class TestPropCont(WikiTestCase):
     """Tests MQuery's PropCont methods"""
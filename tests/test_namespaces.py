@@ -68,6 +68,7 @@ class TestNamespaces(WikiTestCase):
         self.assertEqual("User talk:Me", self.wiki.talk_page_of("User:Me"))
         self.assertEqual("Talk:Hello", self.wiki.talk_page_of("Hello"))
         self.assertIsNone(self.wiki.talk_page_of("File talk:Derp.mp3"))
+        self.assertIsNone(self.wiki.talk_page_of("Media:Derp.mp3"))
 
     def test_page_of(self):
         self.assertEqual("User:Me", self.wiki.page_of("User talk:Me"))
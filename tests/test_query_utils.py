@@ -0,0 +1,157 @@
+import json
+
+from threading import Barrier, Thread
+from time import sleep
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from pwiki.query_constants import ListCont
+from pwiki.query_utils import basic_query
+from pwiki.waction import WAction
+
+from .base import new_wiki
+
+
+def _response(d: dict) -> Mock:
+    """Creates a mock `requests.Response` whose body is `d`.
+
+    Args:
+        d (dict): The json body of the response.
+
+    Returns:
+        Mock: The mock response.
+    """
+    return Mock(content=json.dumps(d).encode())
+
+
+class TestQueryCache(TestCase):
+    """Tests the query cache used by basic_query"""
+
+    def setUp(self) -> None:
+        """Sets up a `Wiki` with query caching enabled and a mock `client.get` which returns a distinct response for every call"""
+        self.wiki = new_wiki(cookie_jar=None, query_cache_ttl=60)
+        self.wiki.client.get = self.get = Mock(side_effect=lambda *args, **kwargs: _response({"query": {"n": self.get.call_count}}))
+
+    def test_cache_hit(self):
+        pl = {"list": "categorymembers", "cmtitle": "Category:Foo"}
+        self.assertEqual(basic_query(self.wiki, pl, cacheable=True), basic_query(self.wiki, pl, cacheable=True))
+        self.get.assert_called_once()
+
+        # test 2 - different parameters are a different query
+        self.assertEqual({"query": {"n": 2}}, basic_query(self.wiki, pl | {"cmtitle": "Category:Bar"}, cacheable=True))
+
+    def test_cache_expiry(self):
+        pl = {"list": "categorymembers", "cmtitle": "Category:Foo"}
+
+        with patch("pwiki.query_utils.monotonic", side_effect=[0, 30, 61, 61]):
+            basic_query(self.wiki, pl, cacheable=True)
+            basic_query(self.wiki, pl, cacheable=True)
+            self.assertEqual(1, self.get.call_count)
+
+            basic_query(self.wiki, pl, cacheable=True)
+            self.assertEqual(2, self.get.call_count)
+
+    def test_cache_cleared_by_action(self):
+        pl = {"list": "categorymembers", "cmtitle": "Category:Foo"}
+        basic_query(self.wiki, pl, cacheable=True)
+
+        self.wiki.client.post = Mock(return_value=_response({"purge": []}))
+        WAction._post_action(self.wiki, "purge", {"titles": "Foo"})
+
+        basic_query(self.wiki, pl, cacheable=True)
+        self.assertEqual(2, self.get.call_count)
+
+    def test_cache_eviction(self):
+        with patch("pwiki.query_utils._QUERY_CACHE_MAX", 2):
+            for title in ("A", "B", "C"):
+                basic_query(self.wiki, {"list": "categorymembers", "cmtitle": title}, cacheable=True)
+
+            self.assertEqual(2, len(self.wiki._query_cache))
+
+            basic_query(self.wiki, {"list": "categorymembers", "cmtitle": "C"}, cacheable=True)
+            self.assertEqual(3, self.get.call_count)
+
+            basic_query(self.wiki, {"list": "categorymembers", "cmtitle": "A"}, cacheable=True)
+            self.assertEqual(4, self.get.call_count)
+
+    def test_uncacheable(self):
+        for pl, cacheable in (({"list": "categorymembers", "cmtitle": "Category:Foo"}, False), ({"list": "allusers", "augroup": ["sysop"]}, True)):
+            basic_query(self.wiki, pl, cacheable=cacheable)
+            basic_query(self.wiki, pl, cacheable=cacheable)
+
+        self.assertEqual(4, self.get.call_count)
+        self.assertFalse(self.wiki._query_cache)
+
+        # test 2 - QConstants whose results may differ between identical queries
+        self.assertFalse(ListCont.RANDOM.cacheable)
+        self.assertFalse(ListCont.STASHED_FILES.cacheable)
+        self.assertTrue(ListCont.CATEGORY_MEMBERS.cacheable)
+
+    def test_modify_response(self):
+        pl = {"list": "categorymembers", "cmtitle": "Category:Foo"}
+        basic_query(self.wiki, pl, cacheable=True)["query"].clear()
+
+        self.assertEqual({"query": {"n": 1}}, basic_query(self.wiki, pl, cacheable=True))
+        self.get.assert_called_once()
+
+
+class TestSharedQueries(TestCase):
+    """Tests the sharing of identical in-flight queries between threads by basic_query"""
+
+    def _run_threads(self, wiki, pl: dict, cacheable: bool = True, n: int = 2) -> list[dict]:
+        """Runs `basic_query(wiki, pl, cacheable=cacheable)` concurrently on `n` threads.
+
+        Returns:
+            list[dict]: The response received by each thread.
+        """
+        results = [None] * n
+
+        def query(i: int):
+            results[i] = basic_query(wiki, pl, cacheable=cacheable)
+
+        threads = [Thread(target=query, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+
+        return results
+
+    def test_shared_query(self):
+        wiki = new_wiki(cookie_jar=None, query_cache_ttl=60)
+
+        def get(*args, **kwargs):
+            sleep(0.2)  # give the other thread time to find this query in flight
+            return _response({"query": {"pages": [{"title": "Foo"}]}})
+
+        wiki.client.get = Mock(side_effect=get)
+        a, b = self._run_threads(wiki, {"list": "categorymembers", "cmtitle": "Category:Foo"})
+
+        wiki.client.get.assert_called_once()
+        self.assertEqual(a, b)
+
+        # test 2 - each caller gets its own copy
+        a["query"]["pages"].clear()
+        self.assertEqual([{"title": "Foo"}], b["query"]["pages"])
+
+    def test_not_shared(self):
+        barrier = Barrier(2, timeout=5)  # breaks if the second request is not sent while the first one is in flight
+
+        def get(*args, **kwargs):
+            barrier.wait()
+            return _response({"query": {"random": [{"title": "Foo"}]}})
+
+        # test 1 - caching disabled
+        wiki = new_wiki(cookie_jar=None)
+        wiki.client.get = Mock(side_effect=get)
+
+        self.assertTrue(all(self._run_threads(wiki, {"list": "categorymembers", "cmtitle": "Category:Foo"})))
+        self.assertEqual(2, wiki.client.get.call_count)
+
+        # test 2 - caching enabled, but the results are random
+        barrier.reset()
+        wiki = new_wiki(cookie_jar=None, query_cache_ttl=60)
+        wiki.client.get = Mock(side_effect=get)
+
+        self.assertTrue(all(self._run_threads(wiki, {"list": "random"}, False)))
+        self.assertEqual(2, wiki.client.get.call_count)
@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from pwiki.utils import make_params
+
+
+class TestUtils(TestCase):
+    """Tests for pwiki's shared utilities"""
+
+    def test_make_params(self):
+        self.assertDictEqual({"format": "json", "formatversion": "2", "action": "query"}, make_params("query"))
+        self.assertDictEqual({"format": "json", "formatversion": "2", "action": "query", "list": "random"}, make_params("query", {"list": "random"}))
+
+        # test 2 - action always wins
+        self.assertEqual("query", make_params("query", {"action": "edit"})["action"])
+
+        # test 3 - returned dicts are independent
+        make_params("query")["list"] = "random"
+        self.assertNotIn("list", make_params("query"))
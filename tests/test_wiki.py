@@ -1,4 +1,5 @@
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock, TestCase
@@ -27,6 +28,13 @@ class TestWikiAction(WikiTestCase):
         with self.assertRaises(ValueError):
             self.wiki.edit("Foo")
 
+    def test_upload(self, mock: mock.Mock):
+        for chunk_size in (0, -1):
+            with self.assertRaises(ValueError):
+                self.wiki.upload(Path("Example.png"), "Example.png", chunk_size=chunk_size)
+
+        mock.assert_not_called()
+
     def test_undelete(self, mock: mock.Mock):
         mock.return_value = file_to_json("undelete")
         self.assertTrue(self.wiki.undelete("User:Fastily", "testing undeletion"))
@@ -56,17 +64,17 @@ class TestWikiAuth(TestCase):
         self.assertEqual("FSock", wiki.username)
 
     @mock.patch("pwiki.wiki.Wiki._refresh_rights")
-    @mock.patch("pwiki.oquery.OQuery.fetch_token")
-    def test_save_load_cookies(self, fetch_token: mock.Mock, refresh_rights: mock.Mock):
+    @mock.patch("pwiki.oquery.OQuery.fetch_session_info")
+    def test_save_load_cookies(self, fetch_session_info: mock.Mock, refresh_rights: mock.Mock):
         with TemporaryDirectory() as d:
             tmp_dir = Path(d)
             u = "Nyan Cat"
-            fetch_token.return_value = "abc123+\\"
+            fetch_session_info.return_value = ("abc123+\\", u, [], None)
 
             # test cookie save
             wiki = new_wiki(cookie_jar=tmp_dir)
 
-            wiki.client.cookies.set("yolo", "foobar", domain="wikipedia.org")
+            wiki.client.cookies.set("yolo", "foobar", domain="wikipedia.org", rest={"HttpOnly": None})
             wiki.username = u
             wiki.is_logged_in = True
             wiki.save_cookies()
@@ -76,6 +84,7 @@ class TestWikiAuth(TestCase):
             # test load
             wiki = new_wiki(username=u, password="hi", cookie_jar=tmp_dir)
             self.assertEqual("foobar", wiki.client.cookies.get("yolo"))
+            self.assertTrue(next(iter(wiki.client.cookies)).has_nonstandard_attr("HttpOnly"))
 
     def test_no_auth_save_error(self):
         with self.assertRaises(RuntimeError):
@@ -133,6 +142,62 @@ class TestWikiQuery(WikiTestCase):
     def test_images_on_page(self):
         self.assertCountEqual(["File:FastilyTest.svg", "File:FastilyTest.png"], self.wiki.images_on_page("User:Fastily/Sandbox/Page"))
 
+    def test_iter_all_users(self):
+        self.assertEqual(3, len(result := list(islice(self.wiki.iter_all_users("rollbacker"), 3))))
+        self.assertListEqual(self.wiki.all_users("rollbacker")[:3], result)
+
+    def test_iter_category_members(self):
+        self.assertListEqual(self.wiki.category_members("Category:Fastily Test2"), list(self.wiki.iter_category_members("Category:Fastily Test2")))
+        self.assertListEqual(["File:FastilyTest.png"], list(self.wiki.iter_category_members("Category:Fastily Test2", NS.FILE)))
+
+    def test_iter_contribs(self):
+        result = list(islice(self.wiki.iter_contribs("FastilyClone", True, [NS.FILE]), 1))
+
+        self.assertEqual(1, len(result))
+        self.assertEqual("File:FCTest1.png", result[0].title)
+
+    @mock.patch("pwiki.query_utils.basic_query", return_value=file_to_json("deleted-revisions"))
+    def test_iter_deleted_revisions(self, m: mock.Mock):
+        result = list(islice(self.wiki.iter_deleted_revisions("User:Fastily/SomePageThatWasDeleted"), 2))
+
+        m.assert_called_once()
+        self.assertEqual(2, len(result))
+        self.assertEqual("Fastily", result[0].user)
+        self.assertEqual("test 1", result[1].summary)
+
+    def test_iter_duplicate_files(self):
+        self.assertTrue(result := list(islice(self.wiki.iter_duplicate_files(), 2)))
+        self.assertTrue(result[0].startswith("File:"))
+
+    def test_iter_logs(self):
+        result = list(self.wiki.iter_logs("File:FastilyTestCircle2.svg", older_first=True))
+
+        self.assertEqual(1, len(result))
+        self.assertEqual("upload", result[0].action)
+        self.assertEqual(datetime.fromisoformat("2016-03-21T02:13:15+00:00"), result[0].timestamp)
+
+    def test_iter_prefix_index(self):
+        self.assertListEqual(["User:FastilyClone/Page/1"], list(self.wiki.iter_prefix_index(NS.USER, "FastilyClone/")))
+        self.assertListEqual(["User:Fastily/Sandbox/Page/1"], list(islice(self.wiki.iter_prefix_index(NS.USER, "Fastily/Sandbox/Page/"), 1)))
+
+    def test_iter_revisions(self):
+        result = list(islice(self.wiki.iter_revisions("User:Fastily/Sandbox/RevisionTest", include_text=True), 2))
+        self.assertEqual(2, len(result))
+        self.assertEqual("foo", result[1].text)
+        self.assertListEqual([r.revid for r in self.wiki.revisions("User:Fastily/Sandbox/RevisionTest")[:2]], [r.revid for r in result])
+
+    def test_iter_search(self):
+        self.assertTrue(result := list(islice(self.wiki.iter_search("Fastily", [NS.USER_TALK]), 1)))
+        self.assertTrue(result[0].startswith("User talk:"))
+
+    @mock.patch("pwiki.query_utils.basic_query", return_value={"query": {"mystashedfiles": [{"filekey": "abc123.png", "size": 1024, "status": "finished"}]}})
+    def test_iter_stashed_files(self, m: mock.Mock):
+        self.assertListEqual([("abc123.png", 1024, "finished")], list(self.wiki.iter_stashed_files()))
+        m.assert_called_once()
+
+    def test_iter_user_uploads(self):
+        self.assertCountEqual(["File:FCTest2.svg", "File:FCTest1.png"], self.wiki.iter_user_uploads("FastilyClone"))
+
     def test_last_editor_of(self):
         self.assertEqual("FSock", self.wiki.last_editor_of("User:Fastily/Sandbox/RevisionTest"))
 